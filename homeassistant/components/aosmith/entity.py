@@ -1,8 +1,10 @@
 """The base entity for the A. O. Smith integration."""
 
+from propcache.api import cached_property
 from py_aosmith import AOSmithAPIClient
 from py_aosmith.models import Device as AOSmithDevice
 
+from homeassistant.core import callback
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
@@ -34,11 +36,22 @@ class AOSmithEntity[
 class AOSmithStatusEntity(AOSmithEntity[AOSmithStatusCoordinator]):
     """Base entity for entities that use data from the status coordinator."""
 
-    @property
+    @cached_property
     def device(self) -> AOSmithDevice:
         """Shortcut to get the device from the coordinator data."""
         return self.coordinator.data[self.junction_id]
 
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self.__dict__.pop("device", None)
+        self._async_update_attrs()
+        super()._handle_coordinator_update()
+
+    @callback
+    def _async_update_attrs(self) -> None:
+        """Recompute attributes derived from the refreshed device."""
+
     @property
     def available(self) -> bool:
         """Return True if entity is available."""
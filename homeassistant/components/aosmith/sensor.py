@@ -1,7 +1,14 @@
-"""The sensor platform for the A. O. Smith integration."""
+"""The sensor platform for the A. O. Smith integration.
+
+The device handed to each value_fn comes from the cached
+AOSmithStatusEntity.device property, which is invalidated on every
+coordinator update before the value is recomputed.
+"""
 
 from collections.abc import Callable
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import partial
+from operator import attrgetter
 
 from py_aosmith.models import Device as AOSmithDevice
 
@@ -12,7 +19,7 @@ from homeassistant.components.sensor import (
     SensorStateClass,
 )
 from homeassistant.const import PERCENTAGE, UnitOfEnergy
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 
 from .coordinator import (
@@ -28,6 +35,11 @@ class AOSmithStatusSensorEntityDescription(SensorEntityDescription):
     """Entity description class for sensors using data from the status coordinator."""
 
     value_fn: Callable[[AOSmithDevice], str | int | None]
+    unique_id_prefix: str = field(init=False, default="")
+
+    def __post_init__(self) -> None:
+        """Precompute the unique id prefix shared by all entities of this description."""
+        object.__setattr__(self, "unique_id_prefix", f"{self.key}_")
 
 
 STATUS_ENTITY_DESCRIPTIONS: tuple[AOSmithStatusSensorEntityDescription, ...] = (
@@ -35,7 +47,7 @@ STATUS_ENTITY_DESCRIPTIONS: tuple[AOSmithStatusSensorEntityDescription, ...] = (
         key="hot_water_availability",
         translation_key="hot_water_availability",
         native_unit_of_measurement=PERCENTAGE,
-        value_fn=lambda device: device.status.hot_water_status,
+        value_fn=attrgetter("status.hot_water_status"),
     ),
 )
 
@@ -48,49 +60,56 @@ async def async_setup_entry(
     """Set up A. O. Smith sensor platform."""
     data = entry.runtime_data
 
-    async_add_entities(
-        AOSmithStatusSensorEntity(data.status_coordinator, description, junction_id)
-        for description in STATUS_ENTITY_DESCRIPTIONS
-        for junction_id in data.status_coordinator.data
-    )
+    entities: list[SensorEntity] = []
+    for junction_id in data.status_coordinator.data:
+        entities.extend(
+            factory(data.status_coordinator, junction_id=junction_id)
+            for factory in _STATUS_FACTORIES
+        )
+        entities.append(AOSmithEnergySensorEntity(data.energy_coordinator, junction_id))
 
-    async_add_entities(
-        AOSmithEnergySensorEntity(data.energy_coordinator, junction_id)
-        for junction_id in data.status_coordinator.data
-    )
+    async_add_entities(entities)
 
 
 class AOSmithStatusSensorEntity(AOSmithStatusEntity, SensorEntity):
     """Class for sensor entities that use data from the status coordinator."""
 
+    __slots__ = ()
+
     entity_description: AOSmithStatusSensorEntityDescription
 
     def __init__(
         self,
         coordinator: AOSmithStatusCoordinator,
+        *,
         description: AOSmithStatusSensorEntityDescription,
         junction_id: str,
     ) -> None:
         """Initialize the entity."""
         super().__init__(coordinator, junction_id)
         self.entity_description = description
-        self._attr_unique_id = f"{description.key}_{junction_id}"
+        self._attr_unique_id = description.unique_id_prefix + junction_id
+        self._async_update_attrs()
 
-    @property
-    def native_value(self) -> str | int | None:
-        """Return the state of the sensor."""
-        return self.entity_description.value_fn(self.device)
+    @callback
+    def _async_update_attrs(self) -> None:
+        """Recompute the sensor value from the refreshed device."""
+        self._attr_native_value = self.entity_description.value_fn(self.device)
 
 
 class AOSmithEnergySensorEntity(AOSmithEnergyEntity, SensorEntity):
     """Class for the energy sensor entity."""
 
+    __slots__ = ()
+
     _attr_translation_key = "energy_usage"
     _attr_device_class = SensorDeviceClass.ENERGY
     _attr_state_class = SensorStateClass.TOTAL_INCREASING
     _attr_native_unit_of_measurement = UnitOfEnergy.KILO_WATT_HOUR
     _attr_suggested_display_precision = 1
 
+    _UNIQUE_ID_PREFIX = "energy_usage_"
+
     def __init__(
         self,
         coordinator: AOSmithEnergyCoordinator,
@@ -98,9 +117,19 @@ class AOSmithEnergySensorEntity(AOSmithEnergyEntity, SensorEntity):
     ) -> None:
         """Initialize the entity."""
         super().__init__(coordinator, junction_id)
-        self._attr_unique_id = f"energy_usage_{junction_id}"
+        self._attr_unique_id = self._UNIQUE_ID_PREFIX + junction_id
+        self._attr_native_value = self.energy_usage
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._attr_native_value = self.energy_usage
+        super()._handle_coordinator_update()
 
-    @property
-    def native_value(self) -> float | None:
-        """Return the state of the sensor."""
-        return self.energy_usage
+
+# Factories with the description pre-bound, built once at import time so setup
+# only has to bind the coordinator and junction id per entity.
+_STATUS_FACTORIES = tuple(
+    partial(AOSmithStatusSensorEntity, description=description)
+    for description in STATUS_ENTITY_DESCRIPTIONS
+)